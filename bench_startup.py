@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark de arranque de CMS_PATHS.py.
+
+Mide el sobrecoste de `CMS_PATHS.py --help` frente a un intérprete vacío y
+comprueba que importar el módulo no carga dependencias pesadas ni crea
+ficheros. Sale con código 1 si se supera el presupuesto, para usarlo como
+control de regresiones:
+
+    python3 bench_startup.py
+    python3 bench_startup.py --runs 20 --budget-ms 80
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CMS_PATHS.py")
+BUDGET_MS = 60  # Sobrecoste máximo (mediana) sobre `python -c pass`
+HEAVY_MODULES = ["requests", "urllib3", "asyncio", "concurrent.futures"]
+
+# Se ejecuta en un directorio vacío: importar no debe tocar el disco ni cargar lo pesado
+IMPORT_CHECK = f"""
+import os, sys
+sys.path.insert(0, {os.path.dirname(SCRIPT)!r})
+import CMS_PATHS
+loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(",".join(loaded))
+print(",".join(sorted(os.listdir("."))))
+"""
+
+
+def median_ms(cmd, runs, cwd):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque de CMS_PATHS.py")
+    parser.add_argument("--runs", type=int, default=10, help="Ejecuciones por medida (por defecto 10)")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS,
+                        help=f"Sobrecoste máximo permitido en ms (por defecto {BUDGET_MS})")
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as workdir:
+        out = subprocess.run([sys.executable, "-c", IMPORT_CHECK], cwd=workdir,
+                             capture_output=True, text=True, check=True).stdout.split("\n")
+        if out[0]:
+            failures.append(f"importar CMS_PATHS carga módulos pesados: {out[0]}")
+        if out[1]:
+            failures.append(f"importar CMS_PATHS crea ficheros: {out[1]}")
+
+        baseline = median_ms([sys.executable, "-c", "pass"], args.runs, workdir)
+        startup = median_ms([sys.executable, SCRIPT, "--help"], args.runs, workdir)
+
+    overhead = startup - baseline
+    print(f"Intérprete vacío:      {baseline:7.1f} ms")
+    print(f"CMS_PATHS.py --help:   {startup:7.1f} ms")
+    print(f"Sobrecoste:            {overhead:7.1f} ms (presupuesto {args.budget_ms:g} ms)")
+
+    if overhead > args.budget_ms:
+        failures.append(f"el arranque supera el presupuesto en {overhead - args.budget_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"[!] {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())